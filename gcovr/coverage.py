@@ -38,6 +38,7 @@ from __future__ import annotations
 from collections import OrderedDict
 import os
 import re
+import sys
 from typing import Any, List, Dict, Iterable, Optional, TypeVar, Union, Literal
 
 from dataclasses import dataclass
@@ -270,7 +271,9 @@ class FunctionCoverage:
         excluded: bool = False,
     ) -> None:
         assert count >= 0
-        self.name = name
+        # The same names are reported for every object file including a
+        # header, intern them to share the strings and speed up the lookups.
+        self.name = sys.intern(name)
         self.count: Dict[int, int] = {lineno: count}
         self.returned: Dict[int, int] = {lineno: returned}
         self.blocks: Dict[int, int] = {lineno: blocks}
@@ -331,15 +334,15 @@ class LineCoverage:
 
     @property
     def is_covered(self) -> bool:
-        return self.is_reportable and self.count > 0
+        return not self.excluded and self.count > 0
 
     @property
     def is_uncovered(self) -> bool:
-        return self.is_reportable and self.count == 0
+        return not self.excluded and self.count == 0
 
     @property
     def has_uncovered_branch(self) -> bool:
-        return not all(branch.is_covered for branch in self.branches.values())
+        return any(branch.count == 0 for branch in self.branches.values())
 
     @property
     def has_uncovered_decision(self) -> bool:
@@ -359,7 +362,7 @@ class LineCoverage:
         total = len(self.branches)
         covered = 0
         for branch in self.branches.values():
-            if branch.is_covered:
+            if branch.count > 0:
                 covered += 1
 
         return CoverageStat(covered=covered, total=total)
@@ -392,7 +395,7 @@ class FileCoverage:
     __slots__ = "filename", "functions", "lines", "parent_dirname"
 
     def __init__(self, filename: str) -> None:
-        self.filename: str = filename
+        self.filename: str = sys.intern(filename)
         self.functions: Dict[str, FunctionCoverage] = {}
         self.lines: Dict[int, LineCoverage] = {}
         self.parent_dirname: str = None
@@ -402,10 +405,11 @@ class FileCoverage:
         covered = 0
 
         for function in self.functions.values():
+            count = function.count
             for lineno, excluded in function.excluded.items():
                 if not excluded:
                     total += 1
-                    if function.count[lineno] > 0:
+                    if count[lineno] > 0:
                         covered += 1
 
         return CoverageStat(covered, total)
@@ -415,44 +419,102 @@ class FileCoverage:
         covered = 0
 
         for line in self.lines.values():
-            if line.is_reportable:
+            if not line.excluded:
                 total += 1
-                if line.is_covered:
+                if line.count > 0:
                     covered += 1
 
         return CoverageStat(covered, total)
 
     def branch_coverage(self) -> CoverageStat:
-        stat = CoverageStat.new_empty()
+        total = 0
+        covered = 0
 
         for line in self.lines.values():
-            if line.is_reportable:
-                stat += line.branch_coverage()
+            if line.branches and not line.excluded:
+                total += len(line.branches)
+                for branch in line.branches.values():
+                    if branch.count > 0:
+                        covered += 1
 
-        return stat
+        return CoverageStat(covered, total)
 
     def decision_coverage(self) -> DecisionCoverageStat:
-        stat = DecisionCoverageStat.new_empty()
+        covered = 0
+        uncheckable = 0
+        total = 0
 
         for line in self.lines.values():
-            if line.is_reportable:
-                stat += line.decision_coverage()
+            if line.decision is not None and not line.excluded:
+                stat = line.decision_coverage()
+                covered += stat.covered
+                uncheckable += stat.uncheckable
+                total += stat.total
 
-        return stat
+        return DecisionCoverageStat(covered, uncheckable, total)
 
     def call_coverage(self) -> CoverageStat:
         covered = 0
         total = 0
 
         for line in self.lines.values():
-            if len(line.calls) > 0:
+            if line.calls:
+                total += len(line.calls)
                 for call in line.calls.values():
-                    total += 1
-                    if call.is_covered:
+                    if call.covered:
                         covered += 1
 
         return CoverageStat(covered, total)
 
+    def summarize(self) -> SummarizedStats:
+        r"""Summarize a file in a single pass over its lines.
+
+        This gives the same result as calling ``line_coverage()``,
+        ``branch_coverage()``, ``decision_coverage()`` and ``call_coverage()``,
+        but visits each line only once.
+        """
+        line_covered = line_total = 0
+        branch_covered = branch_total = 0
+        decision_covered = decision_uncheckable = decision_total = 0
+        call_covered = call_total = 0
+
+        for line in self.lines.values():
+            # Calls are counted even on excluded lines.
+            if line.calls:
+                call_total += len(line.calls)
+                for call in line.calls.values():
+                    if call.covered:
+                        call_covered += 1
+
+            if line.excluded:
+                continue
+
+            line_total += 1
+            if line.count > 0:
+                line_covered += 1
+
+            if line.branches:
+                branch_total += len(line.branches)
+                for branch in line.branches.values():
+                    if branch.count > 0:
+                        branch_covered += 1
+
+            if line.decision is not None:
+                decision = line.decision_coverage()
+                decision_covered += decision.covered
+                decision_uncheckable += decision.uncheckable
+                decision_total += decision.total
+
+        return SummarizedStats(
+            line=CoverageStat(line_covered, line_total),
+            branch=CoverageStat(branch_covered, branch_total),
+            function=self.function_coverage(),
+            decision=DecisionCoverageStat(
+                decision_covered, decision_uncheckable, decision_total
+            ),
+            call=CoverageStat(call_covered, call_total),
+        )
+
 
 CovData = Dict[str, FileCoverage]
 
@@ -501,6 +563,8 @@ class DirectoryCoverage:
         subdirs: CovData_directories = OrderedDict()
         for key in sorted_keys:
             filecov = covdata[key]
+            # The stats of the file are added to every parent directory.
+            filestats = SummarizedStats.from_file(filecov)
             dircov = filecov
             while True:
                 dirname = DirectoryCoverage._get_dirname(dircov.filename, root_filter)
@@ -511,7 +575,7 @@ class DirectoryCoverage:
                 if dirname not in subdirs:
                     subdirs[dirname] = DirectoryCoverage(dirname)
                 subdirs[dirname].children[dircov.filename] = dircov
-                subdirs[dirname].stats += SummarizedStats.from_file(filecov)
+                subdirs[dirname].stats += filestats
                 dircov = subdirs[dirname]
 
         collapse_dirs = set()
@@ -567,6 +631,8 @@ CovData_directories = Dict[str, DirectoryCoverage]
 
 @dataclass
 class SummarizedStats:
+    __slots__ = "line", "branch", "function", "decision", "call"
+
     line: CoverageStat
     branch: CoverageStat
     function: CoverageStat
@@ -592,20 +658,20 @@ class SummarizedStats:
 
     @staticmethod
     def from_file(filecov: FileCoverage) -> SummarizedStats:
-        return SummarizedStats(
-            line=filecov.line_coverage(),
-            branch=filecov.branch_coverage(),
-            function=filecov.function_coverage(),
-            decision=filecov.decision_coverage(),
-            call=filecov.call_coverage(),
-        )
+        return filecov.summarize()
 
     def __iadd__(self, other: SummarizedStats) -> SummarizedStats:
-        self.line += other.line
-        self.branch += other.branch
-        self.function += other.function
-        self.decision += other.decision
-        self.call += other.call
+        self.line.covered += other.line.covered
+        self.line.total += other.line.total
+        self.branch.covered += other.branch.covered
+        self.branch.total += other.branch.total
+        self.function.covered += other.function.covered
+        self.function.total += other.function.total
+        self.decision.covered += other.decision.covered
+        self.decision.uncheckable += other.decision.uncheckable
+        self.decision.total += other.decision.total
+        self.call.covered += other.call.covered
+        self.call.total += other.call.total
         return self
 
 
@@ -613,6 +679,8 @@ class SummarizedStats:
 class CoverageStat:
     """A single coverage metric, e.g. the line coverage percentage of a file."""
 
+    __slots__ = "covered", "total"
+
     covered: int
     """How many elements were covered."""
 
@@ -635,6 +703,8 @@ class CoverageStat:
         Coverage is truncated to one decimal:
         >>> CoverageStat(1234, 10000).percent_or("default")
         12.3
+        >>> CoverageStat(1, 16).percent_or("default")
+        6.2
 
         Coverage is capped at 99.9% unless everything is covered:
         >>> CoverageStat(9999, 10000).percent_or("default")
@@ -655,8 +725,8 @@ class CoverageStat:
 
         # There is at least one uncovered item.
         # Round to 1 decimal and clamp to max 99.9%.
-        ratio = self.covered / self.total
-        return min(99.9, round(ratio * 100.0, 1))
+        percent = round(self.covered / self.total * 100.0, 1)
+        return percent if percent < 99.9 else 99.9
 
     def __iadd__(self, other: CoverageStat) -> CoverageStat:
         self.covered += other.covered
@@ -668,6 +738,8 @@ class CoverageStat:
 class DecisionCoverageStat:
     """A CoverageStat for decision coverage (accounts for Uncheckable cases)."""
 
+    __slots__ = "covered", "uncheckable", "total"
+
     covered: int
     uncheckable: int
     total: int
@@ -32,7 +32,6 @@ from ...coverage import (
 )
 from ...merging import (
     get_merge_mode_from_options,
-    insert_branch_coverage,
     insert_file_coverage,
     insert_line_coverage,
 )
@@ -132,8 +131,10 @@ def _line_from_xml(filename: str, xml_line) -> LineCoverage:
     if is_branch and branch_msg is not None:
         try:
             [covered, total] = branch_msg[branch_msg.rfind("(") + 1 : -1].split("/")
-            for i in range(int(total)):
-                insert_branch_coverage(line, i, _branch_from_json(i, i < int(covered)))
+            covered = int(covered)
+            line.branches = {
+                i: _branch_from_json(i, i < covered) for i in range(int(total))
+            }
         except Exception:
             LOGGER.warning(
                 f"Invalid branch information for line {line.lineno} in file {filename}"
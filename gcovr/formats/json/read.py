@@ -41,7 +41,6 @@ from ...coverage import (
 )
 from ...merging import (
     get_merge_mode_from_options,
-    insert_branch_coverage,
     insert_decision_coverage,
     insert_file_coverage,
     insert_function_coverage,
@@ -142,8 +141,12 @@ def _line_from_json(json_line: dict) -> LineCoverage:
         md5=json_line.get("gcovr/md5", None),
     )
 
-    for branchno, json_branch in enumerate(json_line["branches"]):
-        insert_branch_coverage(line, branchno, _branch_from_json(json_branch))
+    # The branch numbers are the dense indices of the list and the line is
+    # new, so the dict can be built directly without merging each branch.
+    line.branches = {
+        branchno: _branch_from_json(json_branch)
+        for branchno, json_branch in enumerate(json_line["branches"])
+    }
 
     insert_decision_coverage(line, _decision_from_json(json_line.get("gcovr/decision")))
 
@@ -103,20 +103,24 @@ def write_summary_report(covdata, output_file: str, options: Options):
         by_metric="branch" if options.sort_branches else "line",
     )
 
+    stats = SummarizedStats.new_empty()
     for key in keys:
         filename = presentable_filename(covdata[key].filename, options.root_filter)
         if options.json_base:
             filename = "/".join([options.json_base, filename])
 
+        filestats = SummarizedStats.from_file(covdata[key])
+        stats += filestats
+
         json_dict["files"].append(
             {
                 "filename": filename,
-                **_summary_from_stats(SummarizedStats.from_file(covdata[key]), None),
+                **_summary_from_stats(filestats, None),
             }
         )
 
     # Footer & summary
-    json_dict.update(_summary_from_stats(SummarizedStats.from_covdata(covdata), 0.0))
+    json_dict.update(_summary_from_stats(stats, 0.0))
 
     _write_json_result(
         json_dict, output_file, "summary_coverage.json", options.json_summary_pretty
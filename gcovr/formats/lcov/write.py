@@ -47,7 +47,8 @@ def write_report(covdata: CovData, output_file: str, options: Options) -> None:
         fh.write(f"TN:{options.lcov_test_name}\n")
 
         for key in keys:
-            filename = force_unix_separator(covdata[key].filename)
+            filecov = covdata[key]
+            filename = force_unix_separator(filecov.filename)
 
             # SF:<path to the source file>
             fh.write(f"SF:{filename}\n")
@@ -60,8 +61,9 @@ def write_report(covdata: CovData, output_file: str, options: Options) -> None:
 
             functions = 0
             function_hits = 0
-            for function_name in sorted(covdata[key].functions):
-                linenos = list(covdata[key].functions[function_name].count)
+            for function_name in sorted(filecov.functions):
+                function_counts = filecov.functions[function_name].count
+                linenos = list(function_counts)
                 functions += len(linenos)
 
                 def postfix():
@@ -70,8 +72,8 @@ def write_report(covdata: CovData, output_file: str, options: Options) -> None:
                 for lineno in sorted(linenos):
                     # FN:<line number of function start>,[<line number of function end>,]<function name>
                     fh.write(f"FN:{lineno},{function_name}{postfix()}\n")
-                for lineno in sorted(covdata[key].functions[function_name].count):
-                    count = covdata[key].functions[function_name].count[lineno]
+                for lineno in sorted(function_counts):
+                    count = function_counts[lineno]
                     if count:
                         function_hits += 1
                     # FNDA:<execution count>,<function name>
@@ -81,12 +83,12 @@ def write_report(covdata: CovData, output_file: str, options: Options) -> None:
             # FNH:<number of function hit>
             fh.write(f"FNH:{function_hits}\n")
 
-            sorted_lines = sorted(covdata[key].lines)
+            sorted_lines = [filecov.lines[lineno] for lineno in sorted(filecov.lines)]
 
             branches = 0
             branch_hits = 0
-            for lineno in sorted_lines:
-                line_coverage = covdata[key].lines[lineno]
+            for line_coverage in sorted_lines:
+                lineno = line_coverage.lineno
                 if line_coverage.excluded:
                     next
                 branches += len(line_coverage.branches)
@@ -105,8 +107,8 @@ def write_report(covdata: CovData, output_file: str, options: Options) -> None:
             fh.write(f"BRH:{branch_hits}\n")
 
             lines_covered = 0
-            for lineno in sorted_lines:
-                line_coverage = covdata[key].lines[lineno]
+            for line_coverage in sorted_lines:
+                lineno = line_coverage.lineno
                 if line_coverage.count:
                     lines_covered += 1
                 # DA:<line number>,<execution count>[,<checksum>]
@@ -115,7 +117,7 @@ def write_report(covdata: CovData, output_file: str, options: Options) -> None:
             # LH:<number of lines with a non\-zero execution count>
             fh.write(f"LH:{lines_covered}\n")
             # LF:<number of instrumented lines>
-            fh.write(f"LF:{len(covdata[key].lines)}\n")
+            fh.write(f"LF:{len(filecov.lines)}\n")
 
             # End of file section
             fh.write("end_of_record\n")
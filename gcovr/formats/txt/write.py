@@ -176,9 +176,10 @@ def _format_line(name: str, stat: CoverageStat, uncovered_lines: str) -> str:
 
 
 def _covered_lines_str(filecov: FileCoverage) -> str:
-    covered_lines = sorted(
-        line.lineno for line in filecov.lines.values() if not line.is_uncovered
-    )
+    covered_lines = [
+        lineno for lineno, line in filecov.lines.items() if not line.is_uncovered
+    ]
+    covered_lines.sort()
 
     # Walk through the covered lines in sorted order.
     # Find blocks of consecutive uncovered lines, and return
@@ -194,9 +195,10 @@ def _covered_lines_str(filecov: FileCoverage) -> str:
 
 
 def _uncovered_lines_str(filecov: FileCoverage) -> str:
-    uncovered_lines = sorted(
-        line.lineno for line in filecov.lines.values() if line.is_uncovered
-    )
+    uncovered_lines = [
+        lineno for lineno, line in filecov.lines.items() if line.is_uncovered
+    ]
+    uncovered_lines.sort()
 
     # Walk through the uncovered lines in sorted order.
     # Find blocks of consecutive uncovered lines, and return
@@ -212,60 +214,73 @@ def _uncovered_lines_str(filecov: FileCoverage) -> str:
 
 
 def _covered_branches_str(filecov: FileCoverage) -> str:
-    covered_lines = sorted(
-        line.lineno for line in filecov.lines.values() if not line.has_uncovered_branch
-    )
+    covered_lines = [
+        lineno
+        for lineno, line in filecov.lines.items()
+        if not line.has_uncovered_branch
+    ]
+    covered_lines.sort()
 
     # Don't do any aggregation on branch results.
-    return ",".join(str(lineno) for lineno in covered_lines)
+    return ",".join(map(str, covered_lines))
 
 
 def _covered_decisions_str(filecov: FileCoverage) -> str:
-    covered_decisions = sorted(
-        line.lineno
-        for line in filecov.lines.values()
+    covered_decisions = [
+        lineno
+        for lineno, line in filecov.lines.items()
         if not line.has_uncovered_decision
-    )
-    return ",".join(str(lineno) for lineno in covered_decisions)
+    ]
+    covered_decisions.sort()
+    return ",".join(map(str, covered_decisions))
 
 
 def _uncovered_decisions_str(filecov: FileCoverage) -> str:
-    uncovered_decisions = sorted(
-        line.lineno for line in filecov.lines.values() if line.has_uncovered_decision
-    )
-    return ",".join(str(lineno) for lineno in uncovered_decisions)
+    uncovered_decisions = [
+        lineno for lineno, line in filecov.lines.items() if line.has_uncovered_decision
+    ]
+    uncovered_decisions.sort()
+    return ",".join(map(str, uncovered_decisions))
 
 
 def _uncovered_branches_str(filecov: FileCoverage) -> str:
-    uncovered_lines = sorted(
-        line.lineno for line in filecov.lines.values() if line.has_uncovered_branch
-    )
+    uncovered_lines = [
+        lineno for lineno, line in filecov.lines.items() if line.has_uncovered_branch
+    ]
+    uncovered_lines.sort()
 
     # Don't do any aggregation on branch results.
-    return ",".join(str(lineno) for lineno in uncovered_lines)
+    return ",".join(map(str, uncovered_lines))
 
 
 def _find_consecutive_ranges(items: Iterable[int]) -> Iterable[Tuple[int, int]]:
-    first = last = None
-    for item in items:
-        if last is None:
-            first = last = item
-            continue
+    """
+    Find the ranges of consecutive numbers in a sorted sequence.
 
-        if item == (last + 1):
-            last = item
-            continue
+    >>> list(_find_consecutive_ranges([1, 2, 3, 5, 7, 8]))
+    [(1, 3), (5, 5), (7, 8)]
+    >>> list(_find_consecutive_ranges([]))
+    []
+    """
+    iterator = iter(items)
+    for first in iterator:
+        break
+    else:
+        return
 
-        assert first is not None
-        yield first, last
-        first = last = item
+    # Only compare against the previous item, a range is yielded
+    # as soon as a gap is found.
+    last = first
+    for item in iterator:
+        if item != last + 1:
+            yield first, last
+            first = item
+        last = item
 
-    if last is not None:
-        assert first is not None
-        yield first, last
+    yield first, last
 
 
 def _format_range(first: int, last: int) -> str:
     if first == last:
         return str(first)
-    return "{first}-{last}".format(first=first, last=last)
+    return f"{first}-{last}"
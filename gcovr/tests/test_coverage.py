@@ -18,7 +18,16 @@
 # ****************************************************************************
 
 from ..coverage import (
+    BranchCoverage,
+    CallCoverage,
+    DecisionCoverageConditional,
+    DecisionCoverageSwitch,
+    DecisionCoverageUncheckable,
     DirectoryCoverage,
+    FileCoverage,
+    FunctionCoverage,
+    LineCoverage,
+    SummarizedStats,
 )
 
 import os
@@ -57,3 +66,37 @@ def test_get_dirname(test_input, root_dir, expected, capsys) -> None:
     out, err = capsys.readouterr()
     assert out == ""
     assert err == ""
+
+
+def test_summarized_stats_from_file() -> None:
+    r"""The single pass summary must match the separate coverage methods."""
+    filecov = FileCoverage("file.cpp")
+    for lineno, count in [(1, 1), (2, 0), (3, 5), (4, 0), (5, 2)]:
+        filecov.lines[lineno] = LineCoverage(lineno, count=count)
+    filecov.lines[4].excluded = True
+    filecov.lines[1].branches = {
+        0: BranchCoverage(blockno=0, count=1),
+        1: BranchCoverage(blockno=0, count=0),
+    }
+    filecov.lines[4].branches = {0: BranchCoverage(blockno=0, count=3)}
+    filecov.lines[1].decision = DecisionCoverageConditional(1, 0)
+    filecov.lines[3].decision = DecisionCoverageSwitch(5)
+    filecov.lines[5].decision = DecisionCoverageUncheckable()
+    filecov.lines[3].calls = {0: CallCoverage(0, True)}
+    filecov.lines[4].calls = {0: CallCoverage(0, False)}
+    filecov.functions["foo"] = FunctionCoverage(
+        "foo", lineno=1, count=1, returned=1, blocks=100.0
+    )
+
+    stats = SummarizedStats.from_file(filecov)
+    assert stats == SummarizedStats(
+        line=filecov.line_coverage(),
+        branch=filecov.branch_coverage(),
+        function=filecov.function_coverage(),
+        decision=filecov.decision_coverage(),
+        call=filecov.call_coverage(),
+    )
+    assert (stats.line.covered, stats.line.total) == (3, 4)
+    assert (stats.branch.covered, stats.branch.total) == (1, 2)
+    assert (stats.decision.covered, stats.decision.total) == (2, 5)
+    assert (stats.call.covered, stats.call.total) == (1, 2)